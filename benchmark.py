@@ -1,13 +1,118 @@
+import os
 import math
+import time
 import logging
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn
 
-from compression import CompressorFactory, SupportedCompressors, CompressionResult
+from compression import (
+    CompressorFactory,
+    SupportedCompressors,
+    CompressionResult,
+    IndexedFile,
+    build_file_index,
+    build_tar_payload,
+)
+from utils import format_size, setup_logger
+
+try:
+    from numba import float64, njit, prange, void
+except ImportError:
+    njit = None
+    prange = range
+
+# Batches smaller than this are cheaper to score with NumPy than to dispatch to numba
+_NUMBA_MIN_BATCH = 10_000
+
+# Compiled numba kernel, built on first use so importing this module stays fast
+_weissman_kernel = None
+
+
+def _weissman_scores(
+    target_ratios, target_times, reference_ratio, reference_time, alpha, out
+):
+    """Fill out with Weissman Scores; see WeissmanScoreCalculator.calculate_batch."""
+    log_reference_time = math.log(reference_time)
+    for i in prange(target_ratios.shape[0]):
+        if target_ratios[i] > 0.0 and target_times[i] > 0.0:
+            out[i] = (
+                alpha
+                * (reference_ratio / target_ratios[i])
+                * (math.log(target_times[i]) / log_reference_time)
+            )
+        else:
+            out[i] = 0.0
+
+
+def _get_weissman_kernel():
+    """
+    Get the parallel numba build of _weissman_scores, compiling it on first use.
+
+    The kernel is compiled for one explicit signature, matching the contiguous
+    float64 arrays calculate_batch passes, so numba never has to infer types
+    or build further specializations.
+
+    Returns:
+        Optional[Callable]: Compiled kernel, or None if numba isn't installed
+    """
+    global _weissman_kernel
+
+    if _weissman_kernel is None and njit is not None:
+        signature = void(
+            float64[::1], float64[::1], float64, float64, float64, float64[::1]
+        )
+        _weissman_kernel = njit(signature, cache=True, fastmath=True, parallel=True)(
+            _weissman_scores
+        )
+
+    return _weissman_kernel
+
+
+# Results of a run: (compressed size, ratio, time) of each algorithm, in order
+_CachedRun = Tuple[Tuple[int, float, float], ...]
+
+# Results of earlier runs, keyed by CompressionBenchmark._cache_key and evicted
+# least recently used first. Workers are separate processes, so the cache has
+# to live here in the parent.
+_RESULT_CACHE: "OrderedDict[Tuple, _CachedRun]" = OrderedDict()
+_RESULT_CACHE_SIZE = 128
+
+
+def _cache_get(key: Tuple) -> Optional[_CachedRun]:
+    """
+    Look up the cached results of a run, marking them as recently used.
+
+    Args:
+        key (Tuple): Cache key
+
+    Returns:
+        Optional[_CachedRun]: Cached results, or None on a miss
+    """
+    value = _RESULT_CACHE.get(key)
+    if value is not None:
+        _RESULT_CACHE.move_to_end(key)
+    return value
+
+
+def _cache_put(key: Tuple, value: _CachedRun) -> None:
+    """
+    Store the results of a run, evicting the least recently used run if full.
+
+    Args:
+        key (Tuple): Cache key
+        value (_CachedRun): Compressed size, ratio and time of each algorithm
+    """
+    _RESULT_CACHE[key] = value
+    _RESULT_CACHE.move_to_end(key)
+    if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+        _RESULT_CACHE.popitem(last=False)
 
 
 class WeissmanScoreCalculator:
@@ -68,6 +173,128 @@ class WeissmanScoreCalculator:
 
         return self.alpha * compression_term * time_term
 
+    def calculate_batch(
+        self,
+        target_ratios: np.ndarray,
+        target_times: np.ndarray,
+        reference_ratio: float,
+        reference_time: float,
+    ) -> np.ndarray:
+        """
+        Calculate Weissman Scores for many target algorithms against one reference.
+
+        Large batches run through a parallel numba kernel when numba is installed.
+
+        Args:
+            target_ratios (np.ndarray): Compression ratios of the target algorithms
+            target_times (np.ndarray): Times taken by the target algorithms
+            reference_ratio (float): Compression ratio of the reference algorithm (gzip)
+            reference_time (float): Time taken by the reference algorithm (gzip)
+
+        Returns:
+            np.ndarray: Weissman Scores, 0.0 wherever the inputs are not positive
+        """
+        target_ratios = np.ascontiguousarray(target_ratios, dtype=np.float64)
+        target_times = np.ascontiguousarray(target_times, dtype=np.float64)
+        scores = np.zeros_like(target_ratios)
+
+        if reference_ratio <= 0.0 or reference_time <= 0.0:
+            return scores
+
+        kernel = None
+        if target_ratios.size >= _NUMBA_MIN_BATCH:
+            kernel = _get_weissman_kernel()
+
+        if kernel is not None:
+            kernel(
+                target_ratios,
+                target_times,
+                float(reference_ratio),
+                float(reference_time),
+                float(self.alpha),
+                scores,
+            )
+            return scores
+
+        # Only score entries where the ratio and the log are defined
+        valid = (target_ratios > 0.0) & (target_times > 0.0)
+        scores[valid] = (
+            self.alpha
+            * (reference_ratio / target_ratios[valid])
+            * (np.log(target_times[valid]) / math.log(reference_time))
+        )
+
+        return scores
+
+
+# Input shared by every task of a worker process, set by _init_worker
+_worker_file_index: Optional[List[IndexedFile]] = None
+_worker_payload: Optional[bytes] = None
+
+
+def _init_worker(
+    file_index: List[IndexedFile], payload: Optional[bytes], verbose: bool
+) -> None:
+    """
+    Set up a worker process before it runs any benchmark.
+
+    Used as the pool initializer, so the file index and directory payload are
+    sent to each worker once instead of being pickled with every task. Workers
+    started with spawn or forkserver don't inherit the parent's logging setup,
+    so the logger is configured here too.
+
+    Args:
+        file_index (List[IndexedFile]): Files of the input
+        payload (Optional[bytes]): Pre-built tar of a directory input
+        verbose (bool): Whether to enable verbose logging
+    """
+    global _worker_file_index, _worker_payload
+    _worker_file_index = file_index
+    _worker_payload = payload
+    setup_logger(verbose=verbose)
+
+
+def _benchmark_algorithm(
+    algorithm: SupportedCompressors,
+    input_path: Path,
+    original_size: int,
+    logger_name: str,
+) -> CompressionResult:
+    """
+    Benchmark a single compression algorithm.
+
+    Runs inside a worker process, so it lives at module scope to be picklable.
+    Loggers can't be pickled either, so the worker looks its logger up by name.
+    The file index and payload come from _init_worker.
+
+    Args:
+        algorithm (SupportedCompressors): Compression algorithm to benchmark
+        input_path (Path): Path to the file or directory to compress
+        original_size (int): Original size of the input
+        logger_name (str): Name of the logger to use in the worker
+
+    Returns:
+        CompressionResult: Compression result
+    """
+    logger = logging.getLogger(logger_name)
+    logger.info("Benchmarking %s", algorithm.value)
+
+    compressor = CompressorFactory.get_compressor(algorithm, logger)
+    compressed_size, compression_time = compressor.compress(
+        input_path, _worker_file_index, _worker_payload
+    )
+
+    # Calculate compression ratio (original / compressed)
+    compression_ratio = original_size / compressed_size if compressed_size > 0 else 0
+
+    return CompressionResult(
+        algorithm=algorithm.value,
+        original_size=original_size,
+        compressed_size=compressed_size,
+        compression_ratio=compression_ratio,
+        compression_time=compression_time,
+    )
+
 
 class CompressionBenchmark:
     """Benchmarks compression algorithms and calculates Weissman scores."""
@@ -78,6 +305,9 @@ class CompressionBenchmark:
         alpha: float = 1.0,
         console: Optional[Console] = None,
         logger: Optional[logging.Logger] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        verbose: bool = False,
     ):
         """
         Initialize the compression benchmark.
@@ -87,37 +317,87 @@ class CompressionBenchmark:
             alpha (float): Scaling constant for Weissman score calculation
             console (Optional[Console]): Rich console instance for output
             logger (Optional[logging.logger]): Logger instance
+            max_workers (Optional[int]): Number of worker processes (defaults to one per algorithm, capped at the CPU count)
+            use_cache (bool): Whether to reuse results of earlier runs on an unchanged input
+            verbose (bool): Whether worker processes log verbosely
         """
         self.input_path = input_path
         self.weissman_calculator = WeissmanScoreCalculator(alpha)
         self.console = console or Console()
         self.logger = logger or logging.getLogger(__name__)
+        self.max_workers = max_workers
+        self.use_cache = use_cache
+        self.verbose = verbose
 
         # Validate input path
         if not self.input_path.exists():
             raise FileNotFoundError(f"Path does not exist: {self.input_path}")
 
+        self._file_index: List[IndexedFile] = []
+
     def run_benchmarks(
-        self, algorithms: List[SupportedCompressors]
+        self, algorithms: Sequence[SupportedCompressors]
     ) -> List[CompressionResult]:
         """
         Run benchmarks for the specified compression algorithms.
 
+        Each algorithm runs in its own worker process, so independent
+        compressors use separate cores instead of running one after another.
+
         Args:
-            algorithms (List[SupportedCompressors]): List of compression algorithms to benchmark
+            algorithms (Sequence[SupportedCompressors]): Compression algorithms to benchmark
 
         Returns:
             List[CompressionResult]: List of compression results
         """
-        results: List[CompressionResult] = []
+        # Walk the input once per run and share the result with every
+        # compressor, so a reused instance sees changes since the last run
+        self._file_index = build_file_index(self.input_path)
         original_size = self._get_original_size()
 
         self.console.print(
             f"[bold blue]Benchmarking compression algorithms for:[/] {self.input_path}"
         )
-        self.console.print(
-            f"Original size: [green]{self._format_size(original_size)}[/]"
+        self.console.print(f"Original size: [green]{format_size(original_size)}[/]")
+
+        # Partition into the gzip reference, which is always needed even if it
+        # wasn't requested, and the distinct targets scored against it
+        targets = list(
+            dict.fromkeys(
+                algo for algo in algorithms if algo != SupportedCompressors.GZIP
+            )
         )
+        if SupportedCompressors.GZIP not in algorithms:
+            self.logger.info("Running gzip as reference algorithm")
+        jobs = [SupportedCompressors.GZIP] + targets
+
+        # Reuse an earlier run of the same algorithms on this exact input. Runs
+        # are cached whole, so the reference and the targets scored against it
+        # are always timed together, under the same load.
+        completed: Dict[SupportedCompressors, CompressionResult] = {}
+        cache_key = self._cache_key(jobs)
+        cached = _cache_get(cache_key) if self.use_cache else None
+        if cached is not None:
+            self.logger.info("Using cached results")
+            for algorithm, (compressed_size, ratio, time_taken) in zip(jobs, cached):
+                completed[algorithm] = CompressionResult(
+                    algorithm=algorithm.value,
+                    original_size=original_size,
+                    compressed_size=compressed_size,
+                    compression_ratio=ratio,
+                    compression_time=time_taken,
+                )
+        pending = [algorithm for algorithm in jobs if algorithm not in completed]
+
+        # Archive a directory once so the stream codecs all compress the same bytes
+        payload = None
+        if pending and self.input_path.is_dir():
+            start_time = time.perf_counter_ns()
+            payload = build_tar_payload(self.input_path, self._file_index)
+            prep_time = (time.perf_counter_ns() - start_time) / 1e9
+            self.console.print(f"Archive prep: [yellow]{prep_time:.4f} s[/]")
+
+        max_workers = self.max_workers or min(len(pending), os.cpu_count() or 1)
 
         # Create progress bar
         with Progress(
@@ -128,80 +408,94 @@ class CompressionBenchmark:
             console=self.console,
         ) as progress:
             benchmark_task = progress.add_task(
-                "[red]Running benchmarks...", total=len(algorithms)
+                "[red]Running benchmarks...",
+                total=len(jobs),
+                completed=len(jobs) - len(pending),
             )
 
-            # Get reference (gzip) results first if it's in the list
-            reference_result = None
-            for algo in algorithms.copy():
-                if algo == SupportedCompressors.GZIP:
-                    reference_result = self._benchmark_algorithm(algo, original_size)
-                    results.append(reference_result)
-                    algorithms.remove(algo)
-                    progress.update(benchmark_task, advance=1)
-                    break
-
-            # If gzip wasn't in the list, run it separately for reference
-            if reference_result is None:
-                self.logger.info("Running gzip as reference algorithm")
-                reference_result = self._benchmark_algorithm(
-                    SupportedCompressors.GZIP, original_size
+            if pending:
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_worker,
+                    initargs=(self._file_index, payload, self.verbose),
+                ) as executor:
+                    futures = {
+                        executor.submit(
+                            _benchmark_algorithm,
+                            algorithm,
+                            self.input_path,
+                            original_size,
+                            self.logger.name,
+                        ): algorithm
+                        for algorithm in pending
+                    }
+
+                    for future in as_completed(futures):
+                        completed[futures[future]] = future.result()
+                        progress.update(benchmark_task, advance=1)
+
+                _cache_put(
+                    cache_key,
+                    tuple(
+                        (
+                            completed[algorithm].compressed_size,
+                            completed[algorithm].compression_ratio,
+                            completed[algorithm].compression_time,
+                        )
+                        for algorithm in jobs
+                    ),
                 )
 
-            # Run benchmarks for remaining algorithms
-            for algorithm in algorithms:
-                result = self._benchmark_algorithm(algorithm, original_size)
-
-                # Calculate Weissman score
-                result.weissman_score = self.weissman_calculator.calculate(
-                    target_ratio=result.compression_ratio,
-                    target_time=result.compression_time,
-                    reference_ratio=reference_result.compression_ratio,
-                    reference_time=reference_result.compression_time,
-                )
+        # Weissman scores need the reference, so compute them once all runs are done
+        reference_result = completed[SupportedCompressors.GZIP]
+        reference_result.weissman_score = 1.0  # By definition
+        target_results = [completed[algorithm] for algorithm in targets]
+
+        scores = self.weissman_calculator.calculate_batch(
+            target_ratios=np.fromiter(
+                (r.compression_ratio for r in target_results),
+                dtype=np.float64,
+                count=len(target_results),
+            ),
+            target_times=np.fromiter(
+                (r.compression_time for r in target_results),
+                dtype=np.float64,
+                count=len(target_results),
+            ),
+            reference_ratio=reference_result.compression_ratio,
+            reference_time=reference_result.compression_time,
+        )
 
-                results.append(result)
-                progress.update(benchmark_task, advance=1)
+        for result, score in zip(target_results, scores.tolist()):
+            result.weissman_score = score
 
-        # Add Weissman score to reference result if it's in the results list
-        for result in results:
-            if result.algorithm == SupportedCompressors.GZIP.value:
-                result.weissman_score = 1.0  # By definition
+        results = [completed[algorithm] for algorithm in algorithms]
 
         # Display results table
         self._display_results_table(results)
 
         return results
 
-    def _benchmark_algorithm(
-        self, algorithm: SupportedCompressors, original_size: int
-    ) -> CompressionResult:
+    def _cache_key(self, algorithms: Sequence[SupportedCompressors]) -> Tuple:
         """
-        Benchmark a single compression algorithm.
+        Build the result cache key for running algorithms on the input.
+
+        The key includes the resolved input path and its file count, total size
+        and newest modification time, so any change to the input's files
+        invalidates earlier results.
 
         Args:
-            algorithm (SupportedCompressors): Compression algorithm to benchmark
-            original_size (int): Original size of the input
+            algorithms (Sequence[SupportedCompressors]): Compression algorithms of the run
 
         Returns:
-            CompressionResult: Compression result
+            Tuple: Hashable cache key
         """
-        self.logger.info(f"Benchmarking {algorithm.value}")
-
-        compressor = CompressorFactory.get_compressor(algorithm, self.logger)
-        compressed_size, compression_time = compressor.compress(self.input_path)
-
-        # Calculate compression ratio (original / compressed)
-        compression_ratio = (
-            original_size / compressed_size if compressed_size > 0 else 0
-        )
-
-        return CompressionResult(
-            algorithm=algorithm.value,
-            original_size=original_size,
-            compressed_size=compressed_size,
-            compression_ratio=compression_ratio,
-            compression_time=compression_time,
+        return (
+            self.input_path.resolve(),
+            len(self._file_index),
+            sum(indexed.size for indexed in self._file_index),
+            max((indexed.mtime_ns for indexed in self._file_index), default=0),
+            tuple(algorithm.value for algorithm in algorithms),
         )
 
     def _get_original_size(self) -> int:
@@ -211,16 +505,7 @@ class CompressionBenchmark:
         Returns:
             int: Size in bytes
         """
-        if self.input_path.is_file():
-            return self.input_path.stat().st_size
-        elif self.input_path.is_dir():
-            total_size = 0
-            for file_path in self.input_path.glob("**/*"):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-            return total_size
-        else:
-            return 0
+        return sum(indexed.size for indexed in self._file_index)
 
     def _display_results_table(self, results: List[CompressionResult]) -> None:
         """
@@ -244,31 +529,11 @@ class CompressionBenchmark:
         for result in sorted_results:
             table.add_row(
                 result.algorithm,
-                self._format_size(result.original_size),
-                self._format_size(result.compressed_size),
+                format_size(result.original_size),
+                format_size(result.compressed_size),
                 f"{result.compression_ratio:.2f}",
                 f"{result.compression_time:.4f}",
                 f"{result.weissman_score:.4f}",
             )
 
         self.console.print(table)
-
-    @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """
-        Format size in bytes to a human-readable format.
-
-        Args:
-            size_bytes (int): Size in bytes
-
-        Returns:
-            str: Formatted size string
-        """
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.2f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.2f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
@@ -1,21 +1,35 @@
 import os
+import io
 import time
-import gzip
+import zlib
 import bz2
 import lzma
 import zipfile
 import tarfile
-import shutil
 from pathlib import Path
-from typing import Tuple
+from typing import List, NamedTuple, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 from enum import Enum
 from dataclasses import dataclass
-import tempfile
+from operator import attrgetter
 import logging
 
+# Buffer size for copying file data into archives; 1 MiB fits in a modern L2 cache
+_COPY_BUFSIZE = 1 << 20
 
-@dataclass
+# Optional SIMD-accelerated gzip backends
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+try:
+    from zlib_ng import zlib_ng
+except ImportError:
+    zlib_ng = None
+
+
+@dataclass(slots=True)
 class CompressionResult:
     """Data class to store compression benchmark results."""
 
@@ -27,10 +41,107 @@ class CompressionResult:
     weissman_score: float = 0.0
 
 
+class IndexedFile(NamedTuple):
+    """An entry found while walking the input, with its size and modification time."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    is_dir: bool = False
+
+
+def build_file_index(input_path: Path) -> List[IndexedFile]:
+    """
+    Walk the input once and record every file with its size and modification time.
+
+    Uses os.scandir so file types come from the directory entries and each
+    file costs a single stat() call. Entries are listed in the order
+    tarfile.add() archives them: each directory before its contents, and the
+    contents sorted by name. Directories are included, with a size of 0.
+
+    Args:
+        input_path (Path): Path to the file or directory to index
+
+    Returns:
+        List[IndexedFile]: List of indexed files and directories
+    """
+    if input_path.is_file():
+        stat_result = input_path.stat()
+        return [IndexedFile(input_path, stat_result.st_size, stat_result.st_mtime_ns)]
+    elif not input_path.is_dir():
+        return []
+
+    file_index = [IndexedFile(input_path, 0, input_path.stat().st_mtime_ns, True)]
+    pending = _sorted_entries(input_path)[::-1]
+
+    while pending:
+        entry = pending.pop()
+        if entry.is_dir(follow_symlinks=False):
+            file_index.append(
+                IndexedFile(
+                    Path(entry.path),
+                    0,
+                    entry.stat(follow_symlinks=False).st_mtime_ns,
+                    True,
+                )
+            )
+            pending.extend(reversed(_sorted_entries(entry.path)))
+        elif entry.is_file():
+            stat_result = entry.stat()
+            file_index.append(
+                IndexedFile(
+                    Path(entry.path),
+                    stat_result.st_size,
+                    stat_result.st_mtime_ns,
+                )
+            )
+
+    return file_index
+
+
+def _sorted_entries(path: Union[str, Path]) -> List[os.DirEntry]:
+    """
+    List a directory's entries sorted by name.
+
+    Args:
+        path (Union[str, Path]): Path of the directory to list
+
+    Returns:
+        List[os.DirEntry]: Directory entries, sorted by name
+    """
+    with os.scandir(path) as entries:
+        return sorted(entries, key=attrgetter("name"))
+
+
+class _CountingSink(io.RawIOBase):
+    """Write-only stream that counts the bytes written to it and discards them."""
+
+    def __init__(self):
+        """Initialize the sink with a zero byte count."""
+        super().__init__()
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        """The sink only supports writing."""
+        return True
+
+    def write(self, b) -> int:
+        """Count the bytes in the given buffer."""
+        size = memoryview(b).nbytes
+        self.bytes_written += size
+        return size
+
+    def tell(self) -> int:
+        """Return the number of bytes written so far."""
+        return self.bytes_written
+
+
 class SupportedCompressors(Enum):
     """Enum for supported compression algorithms."""
 
     GZIP = "gzip"
+    GZIP_ISAL = "gzip-isal"
+    GZIP_NG = "gzip-ng"
     BZIP2 = "bzip2"
     LZMA = "lzma"
     ZIP = "zip"
@@ -50,18 +161,35 @@ class Compressor(ABC):
         self.logger = logger
 
     @abstractmethod
-    def compress(self, input_path: Path) -> Tuple[int, float]:
+    def compress(
+        self,
+        input_path: Path,
+        file_index: Optional[List[IndexedFile]] = None,
+        payload: Optional[bytes] = None,
+    ) -> Tuple[int, float]:
         """
         Compress the given input path and return the compressed size and time taken.
 
         Args:
             input_path (path): Path to the file or directory to compress
+            file_index (Optional[List[IndexedFile]]): Files of the input, walked on demand if not given
+            payload (Optional[bytes]): Pre-built tar of a directory input, built on demand if not given
 
         Returns:
             Tuple[int, float]: Tuple containing compressed size in bytes and time taken in seconds
         """
         pass
 
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Check whether the libraries this compressor needs are installed.
+
+        Returns:
+            bool: True if the compressor can be used
+        """
+        return True
+
     def get_size(self, path: Path) -> int:
         """
         Get the size of a file or directory.
@@ -72,216 +200,410 @@ class Compressor(ABC):
         Returns:
             int: Size in bytes
         """
-        if path.is_file():
-            return path.stat().st_size
-        elif path.is_dir():
-            return sum(f.stat().st_size for f in path.glob("**/*") if f.is_file())
-        else:
-            return 0
+        return sum(indexed.size for indexed in build_file_index(path))
+
+    def read_input(
+        self,
+        input_path: Path,
+        file_index: Optional[List[IndexedFile]] = None,
+        payload: Optional[bytes] = None,
+    ) -> bytes:
+        """
+        Read the input into a single buffer for stream codecs.
+
+        Files are read as-is; directories are serialized into an uncompressed tar.
+
+        Args:
+            input_path (Path): Path to the file or directory to read
+            file_index (Optional[List[IndexedFile]]): Files of the input, walked on demand if not given
+            payload (Optional[bytes]): Pre-built tar of a directory input, returned as-is if given
+
+        Returns:
+            bytes: Bytes to feed through the codec
+        """
+        if payload is not None:
+            return payload
+        elif input_path.is_file():
+            return input_path.read_bytes()
+
+        return build_tar_payload(input_path, file_index)
+
+
+def read_members(
+    input_path: Path, file_index: Optional[List[IndexedFile]] = None
+) -> List[Tuple[str, bytes]]:
+    """
+    Read every file of the input into memory, keyed by archive name.
+
+    Directories have no contents and are left out.
+
+    Args:
+        input_path (Path): Path to the file or directory to read
+        file_index (Optional[List[IndexedFile]]): Files of the input, walked on demand if not given
+
+    Returns:
+        List[Tuple[str, bytes]]: List of (archive name, file contents) pairs
+    """
+    if file_index is None:
+        file_index = build_file_index(input_path)
+
+    return [
+        (
+            indexed.path.relative_to(input_path.parent).as_posix(),
+            indexed.path.read_bytes(),
+        )
+        for indexed in file_index
+        if not indexed.is_dir
+    ]
+
+
+def build_tar_payload(
+    input_path: Path, file_index: Optional[List[IndexedFile]] = None
+) -> bytearray:
+    """
+    Serialize the input into an uncompressed in-memory tar.
+
+    Building this once lets every stream codec compress the same bytes instead
+    of walking and reading the directory again. The archive is allocated up
+    front from the member sizes and each file is read straight into its slot,
+    so file data is copied once instead of through intermediate buffers.
+
+    Members, their order and their metadata are the same as with
+    tarfile.add(input_path, arcname=input_path.name), so the archive matches
+    what tarfile itself writes for the indexed files and directories.
+
+    Args:
+        input_path (Path): Path to the file or directory to archive
+        file_index (Optional[List[IndexedFile]]): Files of the input, walked on demand if not given
+
+    Returns:
+        bytearray: Uncompressed tar archive
+
+    Raises:
+        OSError: If a file shrank after it was indexed
+    """
+    if file_index is None:
+        file_index = build_file_index(input_path)
+
+    # gettarinfo() stats each member the way tarfile.add() does, and keeps
+    # track of inodes so repeated hard links become link members
+    members = []
+    with tarfile.open(fileobj=io.BytesIO(), mode="w") as tar:
+        for indexed in file_index:
+            tarinfo = tar.gettarinfo(
+                indexed.path, indexed.path.relative_to(input_path.parent).as_posix()
+            )
+            header = tarinfo.tobuf(tar.format, tar.encoding, tar.errors)
+            # Only regular files carry data; links and directories are headers
+            size = tarinfo.size if tarinfo.isreg() else 0
+            members.append((indexed.path, header, size))
+
+    # Members are padded to whole blocks, followed by two zero blocks, and the
+    # archive is padded to whole records
+    archive_size = 2 * tarfile.BLOCKSIZE + sum(
+        len(header) + _round_up(size, tarfile.BLOCKSIZE) for _, header, size in members
+    )
+    payload = bytearray(_round_up(archive_size, tarfile.RECORDSIZE))
+    view = memoryview(payload)
+    offset = 0
+
+    for path, header, size in members:
+        view[offset : offset + len(header)] = header
+        offset += len(header)
+
+        if size:
+            remaining = view[offset : offset + size]
+            with open(path, "rb", buffering=0) as f:
+                while remaining:
+                    bytes_read = f.readinto(remaining)
+                    if not bytes_read:
+                        raise OSError(f"File changed size while archiving: {path}")
+                    remaining = remaining[bytes_read:]
+
+        offset += _round_up(size, tarfile.BLOCKSIZE)
+
+    return payload
+
+
+def _round_up(size: int, multiple: int) -> int:
+    """
+    Round a size up to the next multiple.
+
+    Args:
+        size (int): Size in bytes
+        multiple (int): Multiple to round up to
+
+    Returns:
+        int: Rounded size
+    """
+    return -(-size // multiple) * multiple
+
+
+def _stream_compress(compressor, data: bytes) -> int:
+    """
+    Feed data through an incremental compressor and measure its output.
+
+    Only the size is needed, so output chunks are counted and dropped instead
+    of being collected into a buffer that keeps reallocating as it grows.
+
+    Args:
+        compressor: Object with compress() and flush(), such as zlib.compressobj()
+        data (bytes): Bytes to compress
+
+    Returns:
+        int: Compressed size in bytes
+    """
+    view = memoryview(data)
+    compressed_size = 0
+
+    for offset in range(0, len(view), _COPY_BUFSIZE):
+        compressed_size += len(
+            compressor.compress(view[offset : offset + _COPY_BUFSIZE])
+        )
+
+    return compressed_size + len(compressor.flush())
 
 
 class GzipCompressor(Compressor):
     """Gzip compression implementation."""
 
-    def compress(self, input_path: Path) -> Tuple[int, float]:
+    # zlib-compatible module providing compressobj(), the package it comes from,
+    # and the level to compress at (each module's gzip default)
+    backend = zlib
+    package = "zlib"
+    compresslevel = 9
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """
+        Check whether the gzip backend is installed.
+
+        Returns:
+            bool: True if the backend module could be imported
+        """
+        return cls.backend is not None
+
+    def new_compressobj(self):
+        """
+        Create an incremental compressor producing a gzip stream.
+
+        Returns:
+            Compressor object of the backend module
+        """
+        # wbits=31 selects the gzip container (16 + a 32 KiB window)
+        return self.backend.compressobj(self.compresslevel, wbits=31)
+
+    def compress(
+        self,
+        input_path: Path,
+        file_index: Optional[List[IndexedFile]] = None,
+        payload: Optional[bytes] = None,
+    ) -> Tuple[int, float]:
         """
         Compress using gzip algorithm.
 
         Args:
             input_path (Path): Path to the file or directory to compress
+            file_index (Optional[List[IndexedFile]]): Files of the input, walked on demand if not given
+            payload (Optional[bytes]): Pre-built tar of a directory input, built on demand if not given
 
         Returns:
             Tuple[int, float]: Tuple containing compressed size in bytes and time taken in seconds
         """
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-
-        try:
-            start_time = time.time()
-
-            if input_path.is_file():
-                with open(input_path, "rb") as f_in:
-                    with gzip.open(temp_path, "wb") as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-            else:
-                # For directories, create a tar.gz
-                with tarfile.open(temp_path, "w:gz") as tar:
-                    tar.add(input_path, arcname=input_path.name)
-
-            compression_time = time.time() - start_time
-            compressed_size = self.get_size(temp_path)
-
-            self.logger.debug(
-                f"Gzip compression completed: {compressed_size} bytes in {compression_time:.4f} seconds"
+        if not self.is_available():
+            raise ImportError(
+                f"The '{self.package}' package is required for this backend"
             )
-            return compressed_size, compression_time
 
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                os.unlink(temp_path)
+        # For directories, this is a tar that gets gzipped into a tar.gz
+        data = self.read_input(input_path, file_index, payload)
+
+        start_time = time.perf_counter_ns()
+        compressed_size = _stream_compress(self.new_compressobj(), data)
+        compression_time = (time.perf_counter_ns() - start_time) / 1e9
+
+        self.logger.debug(
+            "Gzip (%s) compression completed: %d bytes in %.4f seconds",
+            self.package,
+            compressed_size,
+            compression_time,
+        )
+        return compressed_size, compression_time
+
+
+class IsalGzipCompressor(GzipCompressor):
+    """Gzip compression using Intel ISA-L (SIMD-accelerated DEFLATE and CRC32)."""
+
+    backend = isal_zlib
+    package = "isal"
+    compresslevel = 3  # ISA-L's highest level
+
+
+class ZlibNgGzipCompressor(GzipCompressor):
+    """Gzip compression using zlib-ng (SIMD-accelerated zlib fork)."""
+
+    backend = zlib_ng
+    package = "zlib-ng"
 
 
 class Bzip2Compressor(Compressor):
     """Bzip2 compression implementation."""
 
-    def compress(self, input_path: Path) -> Tuple[int, float]:
+    compresslevel = 9
+
+    def compress(
+        self,
+        input_path: Path,
+        file_index: Optional[List[IndexedFile]] = None,
+        payload: Optional[bytes] = None,
+    ) -> Tuple[int, float]:
         """
         Compress using bzip2 algorithm.
 
         Args:
             input_path (Path): Path to the file or directory to compress
+            file_index (Optional[List[IndexedFile]]): Files of the input, walked on demand if not given
+            payload (Optional[bytes]): Pre-built tar of a directory input, built on demand if not given
 
         Returns:
             Tuple[int, float]: Tuple containing compressed size in bytes and time taken in seconds
         """
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
+        # For directories, this is a tar that gets compressed into a tar.bz2
+        data = self.read_input(input_path, file_index, payload)
 
-        try:
-            start_time = time.time()
-
-            if input_path.is_file():
-                with open(input_path, "rb") as f_in:
-                    with bz2.open(temp_path, "wb") as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-            else:
-                # For directories, create a tar.bz2
-                with tarfile.open(temp_path, "w:bz2") as tar:
-                    tar.add(input_path, arcname=input_path.name)
-
-            compression_time = time.time() - start_time
-            compressed_size = self.get_size(temp_path)
-
-            self.logger.debug(
-                f"Bzip2 compression completed: {compressed_size} bytes in {compression_time:.4f} seconds"
-            )
-            return compressed_size, compression_time
+        start_time = time.perf_counter_ns()
+        compressed_size = _stream_compress(bz2.BZ2Compressor(self.compresslevel), data)
+        compression_time = (time.perf_counter_ns() - start_time) / 1e9
 
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                os.unlink(temp_path)
+        self.logger.debug(
+            "Bzip2 compression completed: %d bytes in %.4f seconds",
+            compressed_size,
+            compression_time,
+        )
+        return compressed_size, compression_time
 
 
 class LzmaCompressor(Compressor):
     """LZMA compression implementation."""
 
-    def compress(self, input_path: Path) -> Tuple[int, float]:
+    preset = 6
+
+    def compress(
+        self,
+        input_path: Path,
+        file_index: Optional[List[IndexedFile]] = None,
+        payload: Optional[bytes] = None,
+    ) -> Tuple[int, float]:
         """
         Compress using LZMA algorithm.
 
         Args:
             input_path: Path to the file or directory to compress
+            file_index: Files of the input, walked on demand if not given
+            payload: Pre-built tar of a directory input, built on demand if not given
 
         Returns:
             Tuple containing compressed size in bytes and time taken in seconds
         """
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
+        # For directories, this is a tar that gets compressed into a tar.xz
+        data = self.read_input(input_path, file_index, payload)
 
-        try:
-            start_time = time.time()
-
-            if input_path.is_file():
-                with open(input_path, "rb") as f_in:
-                    with lzma.open(temp_path, "wb") as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-            else:
-                # For directories, create a tar.xz
-                with tarfile.open(temp_path, "w:xz") as tar:
-                    tar.add(input_path, arcname=input_path.name)
-
-            compression_time = time.time() - start_time
-            compressed_size = self.get_size(temp_path)
-
-            self.logger.debug(
-                f"LZMA compression completed: {compressed_size} bytes in {compression_time:.4f} seconds"
-            )
-            return compressed_size, compression_time
+        start_time = time.perf_counter_ns()
+        compressed_size = _stream_compress(
+            lzma.LZMACompressor(preset=self.preset), data
+        )
+        compression_time = (time.perf_counter_ns() - start_time) / 1e9
 
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                os.unlink(temp_path)
+        self.logger.debug(
+            "LZMA compression completed: %d bytes in %.4f seconds",
+            compressed_size,
+            compression_time,
+        )
+        return compressed_size, compression_time
 
 
 class ZipCompressor(Compressor):
     """ZIP compression implementation."""
 
-    def compress(self, input_path: Path) -> Tuple[int, float]:
+    def compress(
+        self,
+        input_path: Path,
+        file_index: Optional[List[IndexedFile]] = None,
+        payload: Optional[bytes] = None,
+    ) -> Tuple[int, float]:
         """
         Compress using ZIP algorithm.
 
         Args:
             input_path: Path to the file or directory to compress
+            file_index: Files of the input, walked on demand if not given
+            payload: Ignored; ZIP compresses each file on its own rather than a tar
 
         Returns:
             Tuple containing compressed size in bytes and time taken in seconds
         """
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as temp_file:
-            temp_path = Path(temp_file.name)
+        members = read_members(input_path, file_index)
+        sink = _CountingSink()
 
-        try:
-            start_time = time.time()
-
-            with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                if input_path.is_file():
-                    zipf.write(input_path, arcname=input_path.name)
-                else:
-                    for file_path in input_path.glob("**/*"):
-                        if file_path.is_file():
-                            relative_path = file_path.relative_to(input_path.parent)
-                            zipf.write(file_path, arcname=relative_path)
-
-            compression_time = time.time() - start_time
-            compressed_size = self.get_size(temp_path)
-
-            self.logger.debug(
-                f"ZIP compression completed: {compressed_size} bytes in {compression_time:.4f} seconds"
-            )
-            return compressed_size, compression_time
+        start_time = time.perf_counter_ns()
+        with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for arcname, data in members:
+                zipf.writestr(arcname, data)
+        compression_time = (time.perf_counter_ns() - start_time) / 1e9
+        compressed_size = sink.bytes_written
 
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                os.unlink(temp_path)
+        self.logger.debug(
+            "ZIP compression completed: %d bytes in %.4f seconds",
+            compressed_size,
+            compression_time,
+        )
+        return compressed_size, compression_time
 
 
 class TarCompressor(Compressor):
     """TAR compression implementation (no compression, just archiving)."""
 
-    def compress(self, input_path: Path) -> Tuple[int, float]:
+    def compress(
+        self,
+        input_path: Path,
+        file_index: Optional[List[IndexedFile]] = None,
+        payload: Optional[bytes] = None,
+    ) -> Tuple[int, float]:
         """
         Archive using TAR format (no compression).
 
+        Building the archive is the work being measured, so it's always built
+        and timed here rather than taken from a pre-built payload.
+
         Args:
             input_path (Path): Path to the file or directory to compress
+            file_index (Optional[List[IndexedFile]]): Files of the input, walked on demand if not given
+            payload (Optional[bytes]): Ignored; the archive is always built here
 
         Returns:
             Tuple[int, float]: Tuple containing archived size in bytes and time taken in seconds
         """
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".tar") as temp_file:
-            temp_path = Path(temp_file.name)
+        start_time = time.perf_counter_ns()
+        compressed_size = len(build_tar_payload(input_path, file_index))
+        compression_time = (time.perf_counter_ns() - start_time) / 1e9
 
-        try:
-            start_time = time.time()
-
-            with tarfile.open(temp_path, "w") as tar:
-                tar.add(input_path, arcname=input_path.name)
+        self.logger.debug(
+            "TAR archiving completed: %d bytes in %.4f seconds",
+            compressed_size,
+            compression_time,
+        )
+        return compressed_size, compression_time
 
-            compression_time = time.time() - start_time
-            compressed_size = self.get_size(temp_path)
 
-            self.logger.debug(
-                f"TAR archiving completed: {compressed_size} bytes in {compression_time:.4f} seconds"
-            )
-            return compressed_size, compression_time
-
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                os.unlink(temp_path)
+_COMPRESSORS = {
+    SupportedCompressors.GZIP: GzipCompressor,
+    SupportedCompressors.GZIP_ISAL: IsalGzipCompressor,
+    SupportedCompressors.GZIP_NG: ZlibNgGzipCompressor,
+    SupportedCompressors.BZIP2: Bzip2Compressor,
+    SupportedCompressors.LZMA: LzmaCompressor,
+    SupportedCompressors.ZIP: ZipCompressor,
+    SupportedCompressors.TAR: TarCompressor,
+}
 
 
 class CompressorFactory:
@@ -304,15 +626,9 @@ class CompressorFactory:
         Raises:
             ValueError: If the algorithm is not supported
         """
-        compressors = {
-            SupportedCompressors.GZIP: GzipCompressor,
-            SupportedCompressors.BZIP2: Bzip2Compressor,
-            SupportedCompressors.LZMA: LzmaCompressor,
-            SupportedCompressors.ZIP: ZipCompressor,
-            SupportedCompressors.TAR: TarCompressor,
-        }
-
-        if algorithm not in compressors:
-            raise ValueError(f"Unsupported compression algorithm: {algorithm}")
-
-        return compressors[algorithm](logger)
+        try:
+            return _COMPRESSORS[algorithm](logger)
+        except KeyError:
+            raise ValueError(
+                f"Unsupported compression algorithm: {algorithm}"
+            ) from None
@@ -1,14 +1,104 @@
 import json
-import csv
-import xml.dom.minidom
+from xml.etree import ElementTree
 import html
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 from abc import ABC, abstractmethod
 from enum import Enum
-from dataclasses import asdict
+from dataclasses import fields
+from operator import attrgetter
 
 from compression import CompressionResult
+from utils import format_size
+
+# numpy is only needed to render CSV and HTML, so it's imported on first use
+# to keep this module cheap to import for SupportedFormats
+if TYPE_CHECKING:
+    import numpy as np
+
+# Optional Rust-backed JSON serializer, with the stdlib json as fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Field names of a result, and a getter returning them all as a tuple. Unlike
+# dataclasses.asdict, this doesn't deep-copy every value.
+_RESULT_FIELDS = tuple(field.name for field in fields(CompressionResult))
+_get_result_values = attrgetter(*_RESULT_FIELDS)
+
+# printf-style format of each result field, used when writing CSV rows
+_CSV_FORMATS = ("%s", "%d", "%d", "%s", "%s", "%s")
+
+
+def results_to_array(results: List[CompressionResult]) -> "np.ndarray":
+    """
+    Collect results into a NumPy structured array, one record per result.
+
+    Args:
+        results (List[CompressionResult]): List of compression results
+
+    Returns:
+        np.ndarray: Structured array with one field per result attribute
+    """
+    import numpy as np
+
+    # Size the name field to the longest algorithm so names are never cut off
+    width = max((len(result.algorithm) for result in results), default=1)
+    dtype = np.dtype(
+        [
+            ("algorithm", f"U{width}"),
+            ("original_size", "<i8"),
+            ("compressed_size", "<i8"),
+            ("compression_ratio", "<f8"),
+            ("compression_time", "<f8"),
+            ("weissman_score", "<f8"),
+        ]
+    )
+    return np.array([_get_result_values(result) for result in results], dtype=dtype)
+
+
+# Static parts of the HTML report, around the per-result table rows
+_HTML_HEADER = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>Compression Benchmark Results</title>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                h1 { color: #333; }
+                table { border-collapse: collapse; width: 100%; margin-top: 20px; }
+                th, td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
+                th { background-color: #f2f2f2; }
+                tr:hover { background-color: #f5f5f5; }
+                .container { max-width: 1200px; margin: 0 auto; }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>Compression Benchmark Results</h1>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Algorithm</th>
+                            <th>Original Size</th>
+                            <th>Compressed Size</th>
+                            <th>Compression Ratio</th>
+                            <th>Compression Time (s)</th>
+                            <th>Weissman Score</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+        """
+
+_HTML_FOOTER = """
+                    </tbody>
+                </table>
+            </div>
+        </body>
+        </html>
+        """
 
 
 class SupportedFormats(Enum):
@@ -46,7 +136,13 @@ class JsonExporter(Exporter):
             results (List[CompressionResult]): List of compression results
             output_path (Path): Path to write the JSON file to
         """
-        data = [asdict(result) for result in results]
+        data = [
+            dict(zip(_RESULT_FIELDS, _get_result_values(result))) for result in results
+        ]
+
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
 
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2)
@@ -63,23 +159,18 @@ class XmlExporter(Exporter):
             results (List[CompressionResult]): List of compression results
             output_path (Path): Path to write the XML file to
         """
-        doc = xml.dom.minidom.getDOMImplementation().createDocument(
-            None, "CompressionResults", None
-        )
-        root = doc.documentElement
+        root = ElementTree.Element("CompressionResults")
 
         for result in results:
-            result_elem = doc.createElement("Result")
-            root.appendChild(result_elem)
+            result_elem = ElementTree.SubElement(root, "Result")
 
-            for key, value in asdict(result).items():
-                elem = doc.createElement(key)
-                result_elem.appendChild(elem)
-                text = doc.createTextNode(str(value))
-                elem.appendChild(text)
+            for key, value in zip(_RESULT_FIELDS, _get_result_values(result)):
+                ElementTree.SubElement(result_elem, key).text = str(value)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(doc.toprettyxml(indent="  "))
+        ElementTree.indent(root, space="  ")
+        ElementTree.ElementTree(root).write(
+            output_path, encoding="utf-8", xml_declaration=True
+        )
 
 
 class CsvExporter(Exporter):
@@ -96,13 +187,19 @@ class CsvExporter(Exporter):
         if not results:
             return
 
-        fieldnames = asdict(results[0]).keys()
-
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for result in results:
-                writer.writerow(asdict(result))
+        import numpy as np
+
+        array = results_to_array(results)
+        np.savetxt(
+            output_path,
+            array,
+            fmt=_CSV_FORMATS,
+            delimiter=",",
+            newline="\r\n",
+            header=",".join(array.dtype.names),
+            comments="",
+            encoding="utf-8",
+        )
 
 
 class HtmlExporter(Exporter):
@@ -116,86 +213,42 @@ class HtmlExporter(Exporter):
             results (List[CompressionResult]): List of compression results
             output_path (Path): Path to write the HTML file to
         """
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Compression Benchmark Results</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                h1 { color: #333; }
-                table { border-collapse: collapse; width: 100%; margin-top: 20px; }
-                th, td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
-                th { background-color: #f2f2f2; }
-                tr:hover { background-color: #f5f5f5; }
-                .container { max-width: 1200px; margin: 0 auto; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>Compression Benchmark Results</h1>
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Algorithm</th>
-                            <th>Original Size</th>
-                            <th>Compressed Size</th>
-                            <th>Compression Ratio</th>
-                            <th>Compression Time (s)</th>
-                            <th>Weissman Score</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-        """
-
-        # Sort results by Weissman score (descending)
-        sorted_results = sorted(results, key=lambda r: r.weissman_score, reverse=True)
-
-        for result in sorted_results:
-            original_size = self._format_size(result.original_size)
-            compressed_size = self._format_size(result.compressed_size)
-
-            html_content += f"""
+        parts = [_HTML_HEADER]
+
+        # Sort results by Weissman score (descending), keeping ties in order
+        array = results_to_array(results)
+        array = array[(-array["weissman_score"]).argsort(kind="stable")]
+
+        for (
+            algorithm,
+            original_size,
+            compressed_size,
+            compression_ratio,
+            compression_time,
+            weissman_score,
+        ) in array.tolist():
+            parts.append(f"""
                         <tr>
-                            <td>{html.escape(result.algorithm)}</td>
-                            <td>{original_size}</td>
-                            <td>{compressed_size}</td>
-                            <td>{result.compression_ratio:.2f}</td>
-                            <td>{result.compression_time:.4f}</td>
-                            <td>{result.weissman_score:.4f}</td>
+                            <td>{html.escape(algorithm)}</td>
+                            <td>{format_size(original_size)}</td>
+                            <td>{format_size(compressed_size)}</td>
+                            <td>{compression_ratio:.2f}</td>
+                            <td>{compression_time:.4f}</td>
+                            <td>{weissman_score:.4f}</td>
                         </tr>
-            """
+            """)
 
-        html_content += """
-                    </tbody>
-                </table>
-            </div>
-        </body>
-        </html>
-        """
+        parts.append(_HTML_FOOTER)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        output_path.write_text("".join(parts), encoding="utf-8")
 
-    @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """
-        Format size in bytes to a human-readable format.
 
-        Args:
-            size_bytes (int): Size in bytes
-
-        Returns:
-            str: Formatted size string
-        """
-        if size_bytes < 1024:
-            return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.2f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.2f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
+_EXPORTERS = {
+    SupportedFormats.JSON: JsonExporter,
+    SupportedFormats.XML: XmlExporter,
+    SupportedFormats.CSV: CsvExporter,
+    SupportedFormats.HTML: HtmlExporter,
+}
 
 
 class ExportFactory:
@@ -215,14 +268,7 @@ class ExportFactory:
         Raises:
             ValueError: If the format is not supported
         """
-        exporters = {
-            SupportedFormats.JSON: JsonExporter,
-            SupportedFormats.XML: XmlExporter,
-            SupportedFormats.CSV: CsvExporter,
-            SupportedFormats.HTML: HtmlExporter,
-        }
-
-        if format_type not in exporters:
-            raise ValueError(f"Unsupported export format: {format_type}")
-
-        return exporters[format_type]()
+        try:
+            return _EXPORTERS[format_type]()
+        except KeyError:
+            raise ValueError(f"Unsupported export format: {format_type}") from None
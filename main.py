@@ -1,17 +1,41 @@
 import sys
 import argparse
 from pathlib import Path
-from typing import List
+from typing import Tuple
 
-from rich.console import Console
-
-from compression import SupportedCompressors
+from compression import CompressorFactory, SupportedCompressors
 from export import ExportFactory, SupportedFormats
-from benchmark import CompressionBenchmark
 from utils import validate_input_path, setup_logger
 
-# Initialize Rich console
-console = Console()
+# Every compressor, and the CLI choices with the enum members they map back to
+_ALL_COMPRESSORS = tuple(SupportedCompressors)
+_ALGO_VALUES = tuple(algo.value for algo in _ALL_COMPRESSORS)
+_ALGO_BY_VALUE = {algo.value: algo for algo in _ALL_COMPRESSORS}
+_FORMAT_VALUES = tuple(fmt.value for fmt in SupportedFormats)
+_FORMAT_BY_VALUE = {fmt.value: fmt for fmt in SupportedFormats}
+
+
+def _positive_int(value: str) -> int:
+    """
+    Parse a command line value as a positive integer.
+
+    Args:
+        value (str): Command line value
+
+    Returns:
+        int: Parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If the value isn't a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -32,7 +56,7 @@ def parse_arguments() -> argparse.Namespace:
         "--algorithm",
         "-a",
         type=str,
-        choices=[algo.value for algo in SupportedCompressors] + ["all"],
+        choices=_ALGO_VALUES + ("all",),
         default="all",
         help="Compression algorithm to benchmark (or 'all' for all supported algorithms)",
     )
@@ -45,14 +69,27 @@ def parse_arguments() -> argparse.Namespace:
     )
 
     parser.add_argument(
+        "--workers",
+        "-w",
+        type=_positive_int,
+        help="Number of worker processes (defaults to one per algorithm, capped at the CPU count)",
+    )
+
+    # argparse can't make --output conditionally required, so the pairing is
+    # shown in the help and enforced once after parsing
+    export_group = parser.add_argument_group(
+        "export", "Export results to a file (--export requires --output)"
+    )
+
+    export_group.add_argument(
         "--export",
         "-e",
         type=str,
-        choices=[fmt.value for fmt in SupportedFormats],
+        choices=_FORMAT_VALUES,
         help="Export results in the specified format",
     )
 
-    parser.add_argument(
+    export_group.add_argument(
         "--output", "-o", type=str, help="Output file path for exported results"
     )
 
@@ -76,10 +113,17 @@ def main() -> int:
     Returns:
         int: Exit code (0 for success, non-zero for failure)
     """
-    try:
-        # Parse arguments
-        args = parse_arguments()
+    # Parse arguments first, so --help and usage errors exit before the
+    # heavier imports (rich, numpy, numba) below
+    args = parse_arguments()
+
+    from rich.console import Console
+    from benchmark import CompressionBenchmark
 
+    # Initialize Rich console
+    console = Console()
+
+    try:
         # Setup logger
         logger = setup_logger(verbose=args.verbose)
         logger.info("Starting compression benchmark")
@@ -91,15 +135,25 @@ def main() -> int:
             return 1
 
         # Determine which algorithms to benchmark
-        algorithms: List[SupportedCompressors] = []
+        algorithms: Tuple[SupportedCompressors, ...]
         if args.algorithm == "all":
-            algorithms = list(SupportedCompressors)
+            # Skip optional backends whose libraries aren't installed
+            algorithms = tuple(
+                algo
+                for algo in _ALL_COMPRESSORS
+                if CompressorFactory.get_compressor(algo, logger).is_available()
+            )
         else:
-            algorithms = [SupportedCompressors(args.algorithm)]
+            algorithms = (_ALGO_BY_VALUE[args.algorithm],)
 
         # Create benchmark instance
         benchmark = CompressionBenchmark(
-            input_path=input_path, alpha=args.alpha, console=console, logger=logger
+            input_path=input_path,
+            alpha=args.alpha,
+            console=console,
+            logger=logger,
+            max_workers=args.workers,
+            verbose=args.verbose,
         )
 
         # Run benchmarks
@@ -107,7 +161,7 @@ def main() -> int:
 
         # Export results if requested
         if args.export:
-            export_format = SupportedFormats(args.export)
+            export_format = _FORMAT_BY_VALUE[args.export]
             exporter = ExportFactory.get_exporter(export_format)
             exporter.export(results, Path(args.output))
             console.print(f"[green]Results exported to:[/] {args.output}")
@@ -1,71 +1,206 @@
 import unittest
 import tempfile
 import os
+import shutil
 from pathlib import Path
+import io
+import gzip
+import csv
+import tarfile
 import json
+import logging
+from unittest import mock
+from xml.etree import ElementTree
 
-from compression import (
-    CompressionResult,
-    SupportedCompressors,
-    GzipCompressor,
-    CompressorFactory,
-)
-from export import SupportedFormats, ExportFactory
-from benchmark import WeissmanScoreCalculator
-from utils import validate_input_path, setup_logger
+# Only the light utils module is imported here. Each test class imports the
+# heavier modules it needs (numpy, numba, rich, the compression backends) in
+# setUpClass, so running a single class doesn't pay for all of them.
+from utils import validate_input_path, setup_logger, format_size, secure_delete
 
 # Set up logger for tests
 logger = setup_logger(verbose=False)
 
+# Payloads written by the setUp fixtures, built once rather than per test
+_PAYLOAD_A = b"a" * 10000  # 10 KB test file
+_PAYLOAD_B = b"b" * 1000  # 1 KB per file in the test directory
+_PAYLOAD_ABC = b"abc" * 10000  # 30 KB benchmark input
+
 
 class TestCompression(unittest.TestCase):
     """Test cases for compression module."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Import the compression module."""
+        from compression import (
+            SupportedCompressors,
+            GzipCompressor,
+            IsalGzipCompressor,
+            ZlibNgGzipCompressor,
+            CompressorFactory,
+            TarCompressor,
+            build_file_index,
+            build_tar_payload,
+        )
+
+        cls.SupportedCompressors = SupportedCompressors
+        cls.GzipCompressor = GzipCompressor
+        cls.IsalGzipCompressor = IsalGzipCompressor
+        cls.ZlibNgGzipCompressor = ZlibNgGzipCompressor
+        cls.CompressorFactory = CompressorFactory
+        cls.TarCompressor = TarCompressor
+        cls.build_file_index = staticmethod(build_file_index)
+        cls.build_tar_payload = staticmethod(build_tar_payload)
+
     def setUp(self):
         """Set up test files and directories."""
-        # Create a temporary test file
-        self.test_file = tempfile.NamedTemporaryFile(delete=False)
-        self.test_file.write(b"a" * 10000)  # 10 KB of data
-        self.test_file.close()
-        self.test_file_path = Path(self.test_file.name)
+        # Everything lives in one temporary directory, removed in tearDown
+        self._tmpdir = tempfile.mkdtemp()
 
-        # Create a temporary test directory with files
-        self.test_dir = tempfile.TemporaryDirectory()
-        self.test_dir_path = Path(self.test_dir.name)
+        # Create a test file
+        self.test_file_path = Path(self._tmpdir) / "data"
+        self.test_file_path.write_bytes(_PAYLOAD_A)
+
+        # Create a test directory with files
+        self.test_dir_path = Path(self._tmpdir) / "dir"
+        self.test_dir_path.mkdir()
 
         # Create some files in the test directory
         for i in range(5):
-            with open(self.test_dir_path / f"file{i}.txt", "wb") as f:
-                f.write(b"b" * 1000)  # 1 KB of data per file
+            fd = os.open(
+                self.test_dir_path / f"file{i}.txt",
+                os.O_CREAT | os.O_WRONLY | os.O_TRUNC,
+                0o600,
+            )
+            try:
+                os.write(fd, _PAYLOAD_B)
+            finally:
+                os.close(fd)
 
     def tearDown(self):
         """Clean up test files and directories."""
-        if self.test_file_path.exists():
-            os.unlink(self.test_file_path)
-
-        self.test_dir.cleanup()
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
 
     def test_gzip_compression(self):
         """Test gzip compression on a file."""
-        compressor = GzipCompressor(logger)
+        compressor = self.GzipCompressor(logger)
         compressed_size, compression_time = compressor.compress(self.test_file_path)
 
         self.assertLess(compressed_size, self.test_file_path.stat().st_size)
         self.assertGreater(compression_time, 0)
 
+    def test_directory_compression(self):
+        """Test that every compressor handles a directory input."""
+        for algo in self.SupportedCompressors:
+            compressor = self.CompressorFactory.get_compressor(algo, logger)
+            if not compressor.is_available():
+                continue
+
+            compressed_size, compression_time = compressor.compress(self.test_dir_path)
+
+            self.assertGreater(compressed_size, 0)
+            self.assertGreater(compression_time, 0)
+
+    def test_shared_tar_payload(self):
+        """Test that compressors reuse a pre-built directory payload."""
+        payload = self.build_tar_payload(self.test_dir_path)
+
+        compressed_size, _ = self.GzipCompressor(logger).compress(
+            self.test_dir_path, payload=payload
+        )
+        self.assertEqual(compressed_size, len(gzip.compress(payload)))
+
+        archived_size, _ = self.TarCompressor(logger).compress(
+            self.test_dir_path, payload=payload
+        )
+        self.assertEqual(archived_size, len(payload))
+
+    def test_tar_payload_matches_tarfile(self):
+        """Test that the preallocated tar payload matches tarfile's own output."""
+        (self.test_dir_path / "nested").mkdir()
+        with open(self.test_dir_path / "nested" / "empty.txt", "wb"):
+            pass
+        (self.test_dir_path / "nested" / "vacant").mkdir()
+        os.link(self.test_dir_path / "file0.txt", self.test_dir_path / "link.txt")
+
+        for input_path in (self.test_dir_path, self.test_file_path):
+            with self.subTest(input_path=input_path.name):
+                expected = io.BytesIO()
+                with tarfile.open(fileobj=expected, mode="w") as tar:
+                    tar.add(input_path, arcname=input_path.name)
+
+                self.assertEqual(
+                    self.build_tar_payload(input_path), expected.getvalue()
+                )
+
+    def test_build_file_index(self):
+        """Test that the file index covers nested files with their sizes."""
+        (self.test_dir_path / "nested").mkdir()
+        with open(self.test_dir_path / "nested" / "file5.txt", "wb") as f:
+            f.write(b"c" * 500)
+
+        file_index = self.build_file_index(self.test_dir_path)
+
+        # Directories come before their contents, which are sorted by name
+        self.assertEqual(
+            [
+                indexed.path.relative_to(self._tmpdir).as_posix()
+                for indexed in file_index
+            ],
+            ["dir"]
+            + [f"dir/file{i}.txt" for i in range(5)]
+            + ["dir/nested", "dir/nested/file5.txt"],
+        )
+        self.assertEqual(
+            [indexed.is_dir for indexed in file_index],
+            [True] + [False] * 5 + [True, False],
+        )
+        self.assertEqual(sum(indexed.size for indexed in file_index), 5500)
+        self.assertEqual(
+            self.build_file_index(self.test_file_path)[0].size,
+            self.test_file_path.stat().st_size,
+        )
+
+    def test_gzip_backends(self):
+        """Test that accelerated gzip backends produce valid gzip streams."""
+        for compressor_class in (self.IsalGzipCompressor, self.ZlibNgGzipCompressor):
+            if not compressor_class.is_available():
+                continue
+
+            compressor = compressor_class(logger)
+            data = self.test_file_path.read_bytes()
+            stream = compressor.new_compressobj()
+            compressed = stream.compress(data) + stream.flush()
+            self.assertEqual(gzip.decompress(compressed), data)
+
+            compressed_size, _ = compressor.compress(self.test_file_path)
+            self.assertEqual(compressed_size, len(compressed))
+
     def test_compressor_factory(self):
         """Test that the compressor factory creates the correct compressors."""
-        for algo in SupportedCompressors:
-            compressor = CompressorFactory.get_compressor(algo, logger)
+        for algo in self.SupportedCompressors:
+            compressor = self.CompressorFactory.get_compressor(algo, logger)
             self.assertIsNotNone(compressor)
 
+        with self.assertRaises(ValueError):
+            self.CompressorFactory.get_compressor("rar", logger)
+
 
 class TestWeissmanScore(unittest.TestCase):
     """Test cases for Weissman score calculation."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Import numpy and the benchmark module."""
+        import numpy as np
+        from benchmark import WeissmanScoreCalculator
+
+        cls.np = np
+        cls.WeissmanScoreCalculator = WeissmanScoreCalculator
+
     def test_weissman_calculation(self):
         """Test basic Weissman score calculation."""
-        calculator = WeissmanScoreCalculator(alpha=1.0)
+        calculator = self.WeissmanScoreCalculator(alpha=1.0)
 
         # Equal performance should give a score of 1.0
         score = calculator.calculate(
@@ -88,14 +223,193 @@ class TestWeissmanScore(unittest.TestCase):
         )
         self.assertEqual(score, 0.0)
 
+    def test_weissman_batch_calculation(self):
+        """Test that batch scoring matches the scalar calculation."""
+        calculator = self.WeissmanScoreCalculator(alpha=2.0)
+        ratios = [2.0, 4.0, 0.0, 3.0]
+        times = [0.5, 0.1, 0.2, 0.0]
+
+        scores = calculator.calculate_batch(
+            self.np.array(ratios),
+            self.np.array(times),
+            reference_ratio=2.0,
+            reference_time=0.3,
+        )
+
+        for ratio, time_taken, score in zip(ratios, times, scores):
+            expected = calculator.calculate(
+                target_ratio=ratio,
+                target_time=time_taken,
+                reference_ratio=2.0,
+                reference_time=0.3,
+            )
+            self.assertAlmostEqual(score, expected)
+
+    def test_weissman_large_batch_calculation(self):
+        """Test that large batches (numba kernel when installed) match the scalar calculation."""
+        calculator = self.WeissmanScoreCalculator(alpha=1.5)
+        rng = self.np.random.default_rng(0)
+        ratios = rng.uniform(0.5, 5.0, 20000)
+        times = rng.uniform(0.01, 2.0, 20000)
+        ratios[::7] = 0.0
+
+        scores = calculator.calculate_batch(
+            ratios, times, reference_ratio=2.0, reference_time=0.3
+        )
+
+        for i in range(0, 20000, 997):
+            expected = calculator.calculate(
+                target_ratio=ratios[i],
+                target_time=times[i],
+                reference_ratio=2.0,
+                reference_time=0.3,
+            )
+            self.assertAlmostEqual(scores[i], expected)
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test cases for benchmark module."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Import rich and the compression and benchmark modules."""
+        from rich.console import Console
+        from compression import SupportedCompressors, CompressorFactory
+        from benchmark import CompressionBenchmark
+
+        cls.Console = Console
+        cls.SupportedCompressors = SupportedCompressors
+        cls.CompressorFactory = CompressorFactory
+        cls.CompressionBenchmark = CompressionBenchmark
+
+    def setUp(self):
+        """Set up a test file."""
+        self._tmpdir = tempfile.mkdtemp()
+        self.test_file_path = Path(self._tmpdir) / "data"
+        self.test_file_path.write_bytes(_PAYLOAD_ABC)
+
+    def tearDown(self):
+        """Clean up the test file."""
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def test_run_benchmarks(self):
+        """Test that results keep the requested order and gzip is the reference."""
+        benchmark = self.CompressionBenchmark(
+            self.test_file_path, console=self.Console(file=io.StringIO()), logger=logger
+        )
+        algorithms = [self.SupportedCompressors.BZIP2, self.SupportedCompressors.GZIP]
+        results = benchmark.run_benchmarks(algorithms)
+
+        self.assertEqual([r.algorithm for r in results], ["bzip2", "gzip"])
+        self.assertEqual(
+            algorithms,
+            [self.SupportedCompressors.BZIP2, self.SupportedCompressors.GZIP],
+        )
+        self.assertEqual(results[1].weissman_score, 1.0)
+        for result in results:
+            self.assertEqual(result.original_size, 30000)
+            self.assertLess(result.compressed_size, result.original_size)
+
+    def test_run_benchmarks_cache(self):
+        """Test that unchanged inputs reuse cached results and changed ones don't."""
+        console = self.Console(file=io.StringIO())
+        algorithms = [self.SupportedCompressors.BZIP2]
+
+        first = self.CompressionBenchmark(
+            self.test_file_path, console=console, logger=logger
+        )
+        first_results = first.run_benchmarks(algorithms)
+
+        # The same file through a different path is the same input
+        second = self.CompressionBenchmark(
+            Path(self._tmpdir) / "." / "data", console=console, logger=logger
+        )
+        second_results = second.run_benchmarks(algorithms)
+        self.assertEqual(
+            second_results[0].compression_time, first_results[0].compression_time
+        )
+
+        with open(self.test_file_path, "ab") as f:
+            f.write(b"xyz" * 1000)
+
+        changed = self.CompressionBenchmark(
+            self.test_file_path, console=console, logger=logger
+        )
+        changed_results = changed.run_benchmarks(algorithms)
+        self.assertEqual(changed_results[0].original_size, 33000)
+
+    def test_run_benchmarks_reused_instance(self):
+        """Test that reusing a benchmark picks up changes to the input."""
+        console = self.Console(file=io.StringIO())
+        algorithms = [self.SupportedCompressors.BZIP2]
+        benchmark = self.CompressionBenchmark(
+            self.test_file_path, console=console, logger=logger
+        )
+        first_results = benchmark.run_benchmarks(algorithms)
+
+        for use_cache in (True, False):
+            with self.subTest(use_cache=use_cache):
+                self.test_file_path.write_bytes(os.urandom(1000) * 10)
+                benchmark.use_cache = use_cache
+
+                results = benchmark.run_benchmarks(algorithms)
+
+                self.assertEqual(results[0].original_size, 10000)
+                self.assertNotEqual(
+                    results[0].compressed_size, first_results[0].compressed_size
+                )
+
+    def test_run_benchmarks_directory(self):
+        """Test benchmarking a directory input with every algorithm."""
+        dir_path = Path(self._tmpdir) / "dir"
+        dir_path.mkdir()
+        for i in range(3):
+            (dir_path / f"file{i}.txt").write_bytes(b"d" * 2000)
+
+        benchmark = self.CompressionBenchmark(
+            dir_path, console=self.Console(file=io.StringIO()), logger=logger
+        )
+        algorithms = [
+            algo
+            for algo in self.SupportedCompressors
+            if self.CompressorFactory.get_compressor(algo, logger).is_available()
+        ]
+        results = benchmark.run_benchmarks(algorithms)
+
+        for result in results:
+            self.assertEqual(result.original_size, 6000)
+            self.assertGreater(result.compressed_size, 0)
+
+    def test_run_benchmarks_without_gzip(self):
+        """Test that the gzip reference is not reported unless requested."""
+        benchmark = self.CompressionBenchmark(
+            self.test_file_path, console=self.Console(file=io.StringIO()), logger=logger
+        )
+        results = benchmark.run_benchmarks([self.SupportedCompressors.LZMA])
+
+        self.assertEqual([r.algorithm for r in results], ["lzma"])
+
 
 class TestExport(unittest.TestCase):
     """Test cases for export module."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Import the export module."""
+        from compression import CompressionResult
+        from export import SupportedFormats, ExportFactory, results_to_array
+
+        cls.CompressionResult = CompressionResult
+        cls.SupportedFormats = SupportedFormats
+        cls.ExportFactory = ExportFactory
+        cls.results_to_array = staticmethod(results_to_array)
+
     def setUp(self):
-        """Set up test results."""
+        """Set up test results and a directory to export them to."""
+        self._tmpdir = tempfile.mkdtemp()
+
         self.results = [
-            CompressionResult(
+            self.CompressionResult(
                 algorithm="gzip",
                 original_size=10000,
                 compressed_size=5000,
@@ -103,7 +417,7 @@ class TestExport(unittest.TestCase):
                 compression_time=0.5,
                 weissman_score=1.0,
             ),
-            CompressionResult(
+            self.CompressionResult(
                 algorithm="bzip2",
                 original_size=10000,
                 compressed_size=4000,
@@ -113,54 +427,294 @@ class TestExport(unittest.TestCase):
             ),
         ]
 
+    def tearDown(self):
+        """Clean up exported files."""
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
     def test_json_export(self):
         """Test exporting to JSON format."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as temp_file:
-            output_path = Path(temp_file.name)
+        output_path = Path(self._tmpdir) / "results.json"
 
-        try:
-            exporter = ExportFactory.get_exporter(SupportedFormats.JSON)
+        exporter = self.ExportFactory.get_exporter(self.SupportedFormats.JSON)
+        exporter.export(self.results, output_path)
+
+        # Verify the JSON file, parsing the raw bytes without decoding
+        with open(output_path, "rb") as f:
+            data = json.loads(f.read())
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(data[0]["algorithm"], "gzip")
+        self.assertEqual(data[1]["algorithm"], "bzip2")
+
+        # The stdlib fallback writes the same document
+        with mock.patch("export.orjson", None):
             exporter.export(self.results, output_path)
 
-            # Verify the JSON file
-            with open(output_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        with open(output_path, "rb") as f:
+            self.assertEqual(json.loads(f.read()), data)
 
-            self.assertEqual(len(data), 2)
-            self.assertEqual(data[0]["algorithm"], "gzip")
-            self.assertEqual(data[1]["algorithm"], "bzip2")
-        finally:
-            if output_path.exists():
-                os.unlink(output_path)
+    def test_csv_export(self):
+        """Test exporting to CSV format."""
+        output_path = Path(self._tmpdir) / "results.csv"
+
+        exporter = self.ExportFactory.get_exporter(self.SupportedFormats.CSV)
+        exporter.export(self.results, output_path)
+
+        with open(output_path, "r", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]["algorithm"], "gzip")
+        self.assertEqual(rows[1]["compressed_size"], "4000")
+        self.assertEqual(float(rows[1]["weissman_score"]), 0.8)
+
+    def test_xml_export(self):
+        """Test exporting to XML format."""
+        output_path = Path(self._tmpdir) / "results.xml"
+
+        exporter = self.ExportFactory.get_exporter(self.SupportedFormats.XML)
+        exporter.export(self.results, output_path)
+
+        root = ElementTree.parse(output_path).getroot()
+
+        self.assertEqual(root.tag, "CompressionResults")
+        self.assertEqual(len(root), 2)
+        self.assertEqual(root[1].find("algorithm").text, "bzip2")
+        self.assertEqual(root[1].find("compressed_size").text, "4000")
+
+    def test_html_export(self):
+        """Test exporting to HTML format, sorted by Weissman score."""
+        output_path = Path(self._tmpdir) / "results.html"
+
+        exporter = self.ExportFactory.get_exporter(self.SupportedFormats.HTML)
+        exporter.export(list(reversed(self.results)), output_path)
+
+        content = output_path.read_text(encoding="utf-8")
+
+        self.assertTrue(content.strip().startswith("<!DOCTYPE html>"))
+        self.assertLess(content.index("<td>gzip</td>"), content.index("<td>bzip2</td>"))
+        self.assertIn("<td>9.77 KB</td>", content)
+        self.assertTrue(content.strip().endswith("</html>"))
+
+    def test_results_to_array(self):
+        """Test collecting results into a structured array."""
+        array = self.results_to_array(self.results)
+
+        self.assertEqual(
+            array["algorithm"].tolist(), [r.algorithm for r in self.results]
+        )
+        self.assertEqual(
+            array["weissman_score"].tolist(), [r.weissman_score for r in self.results]
+        )
+        self.assertEqual(len(self.results_to_array([])), 0)
+
+        # Algorithm names are never truncated to a fixed width
+        long_name = self.CompressionResult(
+            "a-rather-long-algorithm-name", 1, 1, 1.0, 0.1, 1.0
+        )
+        self.assertEqual(
+            self.results_to_array([long_name])["algorithm"][0], long_name.algorithm
+        )
 
     def test_export_factory(self):
         """Test that the export factory creates the correct exporters."""
-        for fmt in SupportedFormats:
-            exporter = ExportFactory.get_exporter(fmt)
+        for fmt in self.SupportedFormats:
+            exporter = self.ExportFactory.get_exporter(fmt)
             self.assertIsNotNone(exporter)
 
+        with self.assertRaises(ValueError):
+            self.ExportFactory.get_exporter("yaml")
+
 
 class TestUtils(unittest.TestCase):
     """Test cases for utilities module."""
 
+    # Sizes up to one zeroing chunk take a single pwrite; larger ones span
+    # several chunks, with a tail that isn't a whole block
+    _DELETE_SIZES = (100, 1 << 17, (3 << 17) + 100)
+
+    def setUp(self):
+        """Set up a temporary directory."""
+        self._tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self._tmpdir, ignore_errors=True)
+
+    def _write_linked_file(self, size):
+        """
+        Write a file plus a hard link to it.
+
+        The link keeps the inode alive after secure_delete unlinks the file,
+        so the overwritten contents can be checked.
+
+        Args:
+            size (int): Size of the file in bytes
+
+        Returns:
+            Tuple[Path, Path]: Path of the file and of its hard link
+        """
+        path = Path(self._tmpdir) / "data"
+        keep = Path(self._tmpdir) / "keep"
+        path.write_bytes(b"c" * size)
+        os.link(path, keep)
+        return path, keep
+
+    def test_secure_delete(self):
+        """Test that secure deletion overwrites and removes the file."""
+        for size in self._DELETE_SIZES:
+            with self.subTest(size=size):
+                path, keep = self._write_linked_file(size)
+
+                secure_delete(path)
+
+                self.assertFalse(path.exists())
+                self.assertEqual(keep.read_bytes(), bytes(size))
+                keep.unlink()
+
+                # Missing paths are ignored
+                secure_delete(path)
+
+    def test_secure_delete_uring_batches(self):
+        """Test that io_uring overwrites files spanning several batches."""
+        import utils
+
+        if utils._get_uring() is None:
+            self.skipTest("io_uring is unavailable")
+
+        # Three full batches of chunks and part of a fourth
+        size = (3 * (utils._URING_ENTRIES - 2) + 5) * len(utils._ZERO_CHUNK) + 100
+        path, keep = self._write_linked_file(size)
+
+        errors = []
+        real_overwrite_and_unlink = utils._uring_overwrite_and_unlink
+
+        def overwrite_and_unlink(*args):
+            try:
+                return real_overwrite_and_unlink(*args)
+            except OSError as e:
+                errors.append(e)
+                raise
+
+        with mock.patch(
+            "utils._uring_overwrite_and_unlink", side_effect=overwrite_and_unlink
+        ) as uring_overwrite:
+            secure_delete(path)
+
+        uring_overwrite.assert_called_once()
+        self.assertEqual(errors, [])
+        self.assertFalse(path.exists())
+        self.assertEqual(keep.read_bytes(), bytes(size))
+
+    def test_secure_delete_without_uring(self):
+        """Test secure deletion writing zeros through plain blocking I/O."""
+        import utils
+
+        for size in self._DELETE_SIZES:
+            with self.subTest(size=size):
+                path, keep = self._write_linked_file(size)
+
+                with mock.patch("utils._get_uring", return_value=None), mock.patch(
+                    "utils._direct_overwrite", wraps=utils._direct_overwrite
+                ) as direct_overwrite:
+                    secure_delete(path)
+
+                self.assertFalse(path.exists())
+                self.assertEqual(keep.read_bytes(), bytes(size))
+                keep.unlink()
+
+                if size <= 1 << 17:
+                    # A single pwrite, without the O_DIRECT bulk path
+                    direct_overwrite.assert_not_called()
+                elif utils._O_DIRECT:
+                    direct_overwrite.assert_called_once_with(
+                        mock.ANY, size - size % utils._DIRECT_ALIGN
+                    )
+
+    def test_secure_delete_swapped_path(self):
+        """Test that swapping the path after it's opened can't redirect the zeros."""
+        size = (3 << 17) + 100
+        path, keep = self._write_linked_file(size)
+        other_path = Path(self._tmpdir) / "other"
+        other_path.write_bytes(b"o" * size)
+
+        def swap_path():
+            # Runs once secure_delete has opened the file
+            path.unlink()
+            path.symlink_to(other_path)
+            return None
+
+        with mock.patch("utils._get_uring", side_effect=swap_path):
+            secure_delete(path)
+
+        self.assertEqual(keep.read_bytes(), bytes(size))
+        self.assertEqual(other_path.read_bytes(), b"o" * size)
+
+    def test_secure_delete_skips_special_files(self):
+        """Test that FIFOs and directories are left in place."""
+        fifo_path = Path(self._tmpdir) / "fifo"
+        os.mkfifo(fifo_path)
+        dir_path = Path(self._tmpdir) / "dir"
+        dir_path.mkdir()
+
+        secure_delete(fifo_path)
+        secure_delete(dir_path)
+
+        self.assertTrue(fifo_path.exists())
+        self.assertTrue(dir_path.is_dir())
+
+    def test_secure_delete_fallback(self):
+        """Test that a file that can't be overwritten is still unlinked."""
+        path = Path(self._tmpdir) / "data"
+        path.write_bytes(b"c" * 100)
+
+        with mock.patch("utils._get_uring", return_value=None), mock.patch(
+            "utils.os.fsync", side_effect=OSError(5, "Input/output error")
+        ), self.assertLogs("compression_benchmark", level="ERROR"):
+            secure_delete(path)
+
+        self.assertFalse(path.exists())
+
+    def test_setup_logger(self):
+        """Test that repeated logger setup reuses the configured handler."""
+        handler = setup_logger(verbose=False).handlers[0]
+        self.assertIs(setup_logger(verbose=False).handlers[0], handler)
+
+        try:
+            verbose_logger = setup_logger(verbose=True)
+            self.assertEqual(verbose_logger.level, logging.DEBUG)
+            self.assertEqual(len(verbose_logger.handlers), 1)
+        finally:
+            setup_logger(verbose=False)
+
     def test_validate_input_path(self):
         """Test input path validation."""
         # Valid file path
-        with tempfile.NamedTemporaryFile() as temp_file:
-            path = validate_input_path(temp_file.name)
-            self.assertIsNotNone(path)
-            self.assertTrue(path.is_file())
+        file_path = Path(self._tmpdir) / "data"
+        file_path.write_bytes(b"")
+        path = validate_input_path(str(file_path))
+        self.assertIsNotNone(path)
+        self.assertTrue(path.is_file())
 
         # Valid directory path
-        with tempfile.TemporaryDirectory() as temp_dir:
-            path = validate_input_path(temp_dir)
-            self.assertIsNotNone(path)
-            self.assertTrue(path.is_dir())
+        path = validate_input_path(self._tmpdir)
+        self.assertIsNotNone(path)
+        self.assertTrue(path.is_dir())
 
         # Invalid path
         path = validate_input_path("/nonexistent/path/that/does/not/exist")
         self.assertIsNone(path)
 
+    def test_format_size(self):
+        """Test human-readable size formatting across unit boundaries."""
+        self.assertEqual(format_size(0), "0 B")
+        self.assertEqual(format_size(1023), "1023 B")
+        self.assertEqual(format_size(1024), "1.00 KB")
+        self.assertEqual(format_size(1536 * 1024), "1.50 MB")
+        self.assertEqual(format_size(3 * 1024**3), "3.00 GB")
+        self.assertEqual(format_size(2 * 1024**4), "2.00 TB")
+        self.assertEqual(format_size(2048 * 1024**4), "2048.00 TB")
+
 
 if __name__ == "__main__":
     unittest.main()
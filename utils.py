@@ -1,33 +1,54 @@
 import os
+import errno
 import sys
 import logging
+import mmap
+import stat
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel, validator
 import tempfile
 
+# fcntl is POSIX-only; without it O_DIRECT can't be switched on for an open file
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
-class InputPathModel(BaseModel):
-    """Pydantic model for validating input paths."""
+# Optional io_uring bindings, used to batch secure deletion syscalls
+try:
+    import liburing
+except ImportError:
+    liburing = None
 
-    path: Path
+# (unit, shift) pairs indexed by how many times the size divides by 1024
+_SIZE_UNITS = [("B", 0), ("KB", 10), ("MB", 20), ("GB", 30), ("TB", 40)]
 
-    @validator("path")
-    def path_must_exist(cls, v):
-        """Validate that the path exists."""
-        if not v.exists():
-            raise ValueError(f"Path does not exist: {v}")
-        return v
+# Reusable block of zeros for overwriting files, so memory use stays fixed
+_ZERO_CHUNK = bytes(1 << 17)
 
-    @property
-    def is_file(self) -> bool:
-        """Check if the path is a file."""
-        return self.path.is_file()
+# O_DIRECT transfers must be a multiple of the block size (and 0 disables it
+# on platforms without the flag)
+_O_DIRECT = getattr(os, "O_DIRECT", 0)
+_DIRECT_ALIGN = 4096
 
-    @property
-    def is_dir(self) -> bool:
-        """Check if the path is a directory."""
-        return self.path.is_dir()
+# Opened non-blocking, so secure_delete can't hang on a FIFO
+_O_NONBLOCK = getattr(os, "O_NONBLOCK", 0)
+
+# Logger configured by setup_logger, used for this module's own errors
+_log = logging.getLogger("compression_benchmark")
+
+# Shared formatter for log handlers
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Submission queue depth of the io_uring used by secure_delete
+_URING_ENTRIES = 32
+
+# Lazily created io_uring and the process that owns it (rings aren't fork-safe)
+_uring = None
+_uring_pid = None
 
 
 def validate_input_path(path_str: str) -> Optional[Path]:
@@ -41,14 +62,33 @@ def validate_input_path(path_str: str) -> Optional[Path]:
         Optional[Path]: Path object if valid, None otherwise
     """
     try:
-        path = Path(path_str).resolve()
-        InputPathModel(path=path)
-        return path
-    except (ValueError, Exception) as e:
-        logging.error(f"Invalid path: {e}")
+        # realpath is implemented in C, and stat raises if the path is missing
+        real_path = os.path.realpath(path_str)
+        os.stat(real_path)
+        return Path(real_path)
+    except (OSError, ValueError) as e:
+        _log.error("Invalid path: %s", e)
         return None
 
 
+def format_size(size_bytes: int) -> str:
+    """
+    Format size in bytes to a human-readable format.
+
+    Args:
+        size_bytes (int): Size in bytes
+
+    Returns:
+        str: Formatted size string
+    """
+    unit_index = min(max(0, (size_bytes.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    if unit_index == 0:
+        return f"{size_bytes} B"
+
+    unit, shift = _SIZE_UNITS[unit_index]
+    return f"{size_bytes / (1 << shift):.2f} {unit}"
+
+
 def setup_logger(verbose: bool = False) -> logging.Logger:
     """
     Set up and configure logger.
@@ -62,21 +102,28 @@ def setup_logger(verbose: bool = False) -> logging.Logger:
     log_level = logging.DEBUG if verbose else logging.INFO
 
     logger = logging.getLogger("compression_benchmark")
+
+    # Already configured by us at this level, nothing to do
+    if (
+        logger.level == log_level
+        and len(logger.handlers) == 1
+        and logger.handlers[0].level == log_level
+        and logger.handlers[0].formatter is _FORMATTER
+    ):
+        return logger
+
     logger.setLevel(log_level)
 
+    # Records are handled here only, not passed on to the root logger's handlers
+    logger.propagate = False
+
     # Clear existing handlers
     logger.handlers = []
 
     # Create console handler
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(log_level)
-
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
 
     # Add handler to logger
     logger.addHandler(console_handler)
@@ -100,30 +147,227 @@ def secure_temp_file() -> Path:
     return temp_path
 
 
+def _get_uring():
+    """
+    Get this process's io_uring, setting it up on first use.
+
+    Returns:
+        Optional[liburing.Ring]: The ring, or None if io_uring is unavailable
+    """
+    global _uring, _uring_pid
+
+    if liburing is None:
+        return None
+
+    if _uring_pid != os.getpid():
+        _uring_pid = os.getpid()
+        _uring = liburing.Ring()
+        try:
+            liburing.io_uring_queue_init(_URING_ENTRIES, _uring)
+        except OSError:
+            # Kernel too old, or io_uring disabled (e.g. by a seccomp policy)
+            _uring = None
+
+    return _uring
+
+
+def _discard_uring() -> None:
+    """Drop this process's io_uring, so _get_uring sets up a fresh one."""
+    global _uring, _uring_pid
+
+    if _uring is not None and _uring_pid == os.getpid():
+        liburing.io_uring_queue_exit(_uring)
+    _uring = None
+    _uring_pid = None
+
+
+def _uring_overwrite_and_unlink(ring, fd: int, path: Path, file_size: int) -> None:
+    """
+    Overwrite a file with zeros, fsync and unlink it through io_uring.
+
+    Each batch of chunked writes is submitted as one linked chain, and the
+    fsync and unlink are linked after the last write, so the whole deletion
+    of a small file costs a single submission.
+
+    Args:
+        ring (liburing.Ring): io_uring to submit to
+        fd (int): File descriptor of the file, open for writing
+        path (Path): Path to the file to delete
+        file_size (int): Number of bytes to overwrite
+
+    Raises:
+        OSError: If any of the operations fails or writes short
+    """
+    cqe = liburing.Cqe()
+    offset = 0
+    done = False
+    while not done:
+        expected = []
+        # Keep tail buffers referenced until their writes complete
+        buffers = []
+        while offset < file_size and len(expected) < _URING_ENTRIES - 2:
+            length = min(len(_ZERO_CHUNK), file_size - offset)
+            buffers.append(
+                _ZERO_CHUNK if length == len(_ZERO_CHUNK) else _ZERO_CHUNK[:length]
+            )
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, fd, buffers[-1], offset)
+            liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+            liburing.io_uring_sqe_set_data64(sqe, len(expected))
+            expected.append(length)
+            offset += length
+
+        done = offset >= file_size
+        if done:
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_fsync(sqe, fd)
+            liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+            liburing.io_uring_sqe_set_data64(sqe, len(expected))
+            expected.append(0)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_unlink(sqe, os.fspath(path))
+            liburing.io_uring_sqe_set_data64(sqe, len(expected))
+            expected.append(0)
+        else:
+            # A chain can't span submissions, so end it at the batch
+            liburing.io_uring_sqe_set_flags(sqe, 0)
+
+        # Reap every completion of the batch one at a time, since a batch can
+        # wrap around the end of the completion ring. Each one is tagged with
+        # its index in the batch, which is where its result goes.
+        results = [0] * len(expected)
+        try:
+            liburing.io_uring_submit(ring)
+            for _ in range(len(expected)):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                completion = cqe[0]
+                results[completion.user_data] = completion.res
+                liburing.io_uring_cqe_seen(ring, completion)
+        except OSError:
+            # Entries left in the ring would be taken for the next batch's, so
+            # set up a fresh ring next time
+            _discard_uring()
+            raise
+
+        # Links complete in order, so the first failure is the real one
+        for res, length in zip(results, expected):
+            if res < 0:
+                raise OSError(-res, os.strerror(-res), str(path))
+            if res != length:
+                raise OSError(errno.EIO, "Short write", str(path))
+
+
+def _direct_overwrite(fd: int, size: int) -> int:
+    """
+    Overwrite the start of an open file with zeros through O_DIRECT.
+
+    Bypassing the page cache keeps the zeros, which are never read back, from
+    evicting cached benchmark data. O_DIRECT is switched on for the given
+    descriptor and off again afterwards, rather than reopening the file by a
+    path that may by now name a different file.
+
+    Args:
+        fd (int): File descriptor of the file, open for writing
+        size (int): Number of bytes to overwrite, a multiple of the block size
+
+    Returns:
+        int: Number of bytes overwritten, 0 if O_DIRECT isn't supported
+    """
+    if fcntl is None:
+        return 0
+
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    try:
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags | _O_DIRECT)
+    except OSError as e:
+        # Filesystems such as tmpfs reject O_DIRECT
+        if e.errno == errno.EINVAL:
+            return 0
+        raise
+
+    offset = 0
+    try:
+        # Anonymous maps are page-aligned and zero-filled, as O_DIRECT needs
+        with mmap.mmap(-1, len(_ZERO_CHUNK)) as buffer:
+            chunk = memoryview(buffer)
+            try:
+                while offset < size:
+                    offset += os.pwrite(fd, chunk[: size - offset], offset)
+            except OSError as e:
+                # Some filesystems only reject O_DIRECT on the first write
+                if e.errno != errno.EINVAL:
+                    raise
+            finally:
+                chunk.release()
+    finally:
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags)
+
+    # Keep to whole blocks, in case a write came up short
+    return offset - offset % _DIRECT_ALIGN
+
+
 def secure_delete(path: Path) -> None:
     """
     Securely delete a file by overwriting it with zeros before unlinking.
 
+    Missing paths and anything that isn't a regular file are left alone. If
+    the file can't be overwritten it is still unlinked, and the error logged.
+
     Args:
         path (Path): Path to the file to delete
+
+    Raises:
+        OSError: If the file couldn't be removed at all
     """
-    if path.exists() and path.is_file():
+    try:
+        fd = os.open(path, os.O_WRONLY | _O_NONBLOCK)
         try:
-            # Get file size
-            file_size = path.stat().st_size
-
-            # Overwrite with zeros
-            with open(path, "wb") as f:
-                f.write(b"\x00" * file_size)
-                f.flush()
-                os.fsync(f.fileno())
-
-            # Delete the file
-            os.unlink(path)
-        except Exception as e:
-            logging.error(f"Error securely deleting {path}: {e}")
-            # Fallback to regular delete
-            try:
-                os.unlink(path)
-            except Exception:
-                pass
+            # One fstat on the open file, rather than racing separate checks
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode):
+                return
+            file_size = st.st_size
+
+            ring = _get_uring()
+            if ring is not None:
+                try:
+                    _uring_overwrite_and_unlink(ring, fd, path, file_size)
+                    return
+                except OSError:
+                    # Fall back to plain blocking I/O below
+                    pass
+
+            chunk = memoryview(_ZERO_CHUNK)
+            if file_size <= len(_ZERO_CHUNK):
+                # Small files take a single pwrite, without switching to
+                # O_DIRECT and setting up an aligned buffer
+                offset = os.pwrite(fd, chunk[:file_size], 0)
+            else:
+                # Overwrite whole blocks in place with O_DIRECT where supported
+                offset = 0
+                direct_size = file_size - file_size % _DIRECT_ALIGN
+                if _O_DIRECT:
+                    offset = _direct_overwrite(fd, direct_size)
+
+            # Overwrite the rest (the tail, or everything without O_DIRECT, or
+            # after a short write) with zeros, one chunk at a time
+            while offset < file_size:
+                offset += os.pwrite(fd, chunk[: file_size - offset], offset)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        # Delete the file
+        os.unlink(path)
+        return
+    except (FileNotFoundError, IsADirectoryError):
+        # Missing, or removed meanwhile, or a directory: nothing to do
+        return
+    except OSError as e:
+        # A FIFO without a reader can't be opened non-blocking, leave it too
+        if e.errno == errno.ENXIO:
+            return
+        _log.error("Error securely deleting %s: %s", path, e)
+
+    # Fall back to a regular delete
+    path.unlink(missing_ok=True)